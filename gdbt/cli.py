@@ -89,8 +89,9 @@ def validate(scope: str, update: bool) -> None:
             templates = gdbt.code.templates.load(path_current)
 
             spinner.text = "Resolving resources"
-            for name, template in templates.items():
-                template.resolve(name, configuration, str(path_base), update)
+            gdbt.code.templates.resolve(
+                templates, configuration, str(path_base), update
+            )
 
             spinner.succeed(
                 rich.style.Style(color="green", bold=True).render(
@@ -134,13 +135,12 @@ def plan(scope: str, update: bool) -> None:
             templates = gdbt.code.templates.load(path_current)
 
             spinner.text = "Resolving resources"
-            resources_desired = {
-                name: typing.cast(
-                    gdbt.resource.ResourceGroup,
-                    template.resolve(name, configuration, str(path_base), update),
-                )
-                for name, template in templates.items()
-            }
+            resources_desired = typing.cast(
+                typing.Dict[str, gdbt.resource.ResourceGroup],
+                gdbt.code.templates.resolve(
+                    templates, configuration, str(path_base), update
+                ),
+            )
 
             spinner.text = "Loading resource state"
             states = gdbt.state.StateLoader(configuration).load(path_relative)
@@ -218,13 +218,12 @@ def apply(scope: str, auto_approve: bool, update: bool) -> None:
             templates = gdbt.code.templates.load(path_current)
 
             spinner.text = "Resolving resources"
-            resources_desired = {
-                name: typing.cast(
-                    gdbt.resource.ResourceGroup,
-                    template.resolve(name, configuration, str(path_base), update),
-                )
-                for name, template in templates.items()
-            }
+            resources_desired = typing.cast(
+                typing.Dict[str, gdbt.resource.ResourceGroup],
+                gdbt.code.templates.resolve(
+                    templates, configuration, str(path_base), update
+                ),
+            )
 
             spinner.text = "Loading resource state"
             states = gdbt.state.StateLoader(configuration).load(path_relative)
@@ -76,8 +76,11 @@ class ConfigurationLoader:
             configuration = deserialize.deserialize(
                 Configuration, configuration_data.as_attrdict()
             )
+            for provider in configuration.providers.values():
+                attr.validate(typing.cast(typing.Any, provider))
         except (
             TypeError,
+            ValueError,
             envtoml.toml.TomlDecodeError,
             deserialize.DeserializeException,
         ) as exc:
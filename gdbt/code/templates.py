@@ -1,4 +1,6 @@
 import abc
+import concurrent.futures
+import functools
 import hashlib
 import json
 import pathlib
@@ -13,16 +15,31 @@ import yaml
 
 import gdbt.errors
 from gdbt.code.configuration import Configuration, ConfigurationLoader
-from gdbt.dynamic import Evaluation, EvaluationLock, Lookup
+from gdbt.dynamic import Evaluation, EvaluationCache, EvaluationLock, Lookup
 from gdbt.provider import EvaluationProvider
 from gdbt.resource import Resource
 
+try:
+    import orjson  # type: ignore
+
+    _json_loads: typing.Callable[[str], typing.Any] = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 TEMPLATE_VARIABLE_DELIMITER_LEFT = "{$"
 TEMPLATE_VARIABLE_DELIMITER_RIGHT = "$}"
+UID_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=UID_CACHE_SIZE)
+def _uid_for(name: str) -> str:
+    uid_hash = hashlib.md5(name.encode(), usedforsecurity=False)
+    uid = "gdbt_" + uid_hash.hexdigest()
+    return uid
 
 
 @deserialize.downcast_field("kind")
-@attr.s(kw_only=True)
+@attr.s(slots=True, kw_only=True)
 class Template(abc.ABC):
     kind: str = attr.ib()
     provider: str = attr.ib()
@@ -45,29 +62,38 @@ class Template(abc.ABC):
         pass
 
     def resolve_vars(
-        self, configuration: Configuration, base: str, name: str, update: bool = False
+        self,
+        configuration: Configuration,
+        base: str,
+        name: str,
+        update: bool = False,
+        evaluation_cache: typing.Optional[EvaluationCache] = None,
     ) -> typing.Tuple[typing.Dict[str, typing.Any], typing.Dict[str, typing.Any]]:
+        if evaluation_cache is None:
+            evaluation_cache = EvaluationCache()
+        evaluations = self.evaluations or {}
+        evaluations_resolved = {}
+        evaluation_hashes = {}
+        lock = EvaluationLock(base, name)
+        providers = typing.cast(
+            typing.Mapping[str, EvaluationProvider], configuration.providers
+        )
         try:
-            evaluations_resolved = {}
-            lock = EvaluationLock(base, name)
-            for evaluation_name, evaluation in (self.evaluations or {}).items():
-                evaluation_source = typing.cast(
-                    EvaluationProvider, configuration.providers[evaluation.source]
-                )
+            for evaluation_name, evaluation in evaluations.items():
                 evaluation_hash = evaluation.hash
                 evaluation_value = lock.load(evaluation_name, evaluation_hash)
                 if evaluation_value is None or update:
-                    evaluation_value = evaluation.evaluate(evaluation_source)
+                    evaluation_value = evaluation_cache.evaluate(
+                        evaluation, providers[evaluation.source]
+                    )
                     update = True
-                evaluations_resolved.update({evaluation_name: evaluation_value})
-            if update:
-                lock.dump(
-                    evaluations_resolved,
-                    {k: v.hash for k, v in (self.evaluations or {}).items()},
-                )
+                evaluations_resolved[evaluation_name] = evaluation_value
+                evaluation_hashes[evaluation_name] = evaluation_hash
         except KeyError as exc:
             raise gdbt.errors.ProviderNotFound(str(exc)) from None
-        lookups_resolved = {name: value for name, value in (self.lookups or {}).items()}
+        if update:
+            lock.dump(evaluations_resolved, evaluation_hashes)
+        lookups_resolved = self.lookups or {}
         return evaluations_resolved, lookups_resolved
 
     def resolve_loops(
@@ -82,39 +108,50 @@ class Template(abc.ABC):
         for item in iterator:
             yield item
 
+    def resolve_item(
+        self,
+        name: str,
+        item: typing.Optional[str],
+        evaluations: typing.Dict[str, Evaluation],
+        lookups: typing.Dict[str, Lookup],
+        configuration: Configuration,
+        model_template: "Model",
+    ) -> typing.Tuple[str, Resource]:
+        resource_name = f"{name}:{item}" if item else name
+        uid = self.format_uid(resource_name)
+        model = model_template.render(evaluations, lookups, configuration, item)
+        resource = self.make_resource(self.provider, uid, model)
+        return resource_name, resource
+
     def resolve(
         self,
         name: str,
         configuration: Configuration,
         base: str,
         update: bool,
+        evaluation_cache: typing.Optional[EvaluationCache] = None,
     ) -> typing.Dict[str, Resource]:
-        evaluations, lookups = self.resolve_vars(configuration, base, name, update)
+        evaluations, lookups = self.resolve_vars(
+            configuration, base, name, update, evaluation_cache
+        )
+        model_template = Model(self.model)
         resources = {}
         for item in self.resolve_loops(evaluations, lookups):
-            resource_name = name
-            if item:
-                resource_name += f":{item}"
-            uid = self.format_uid(resource_name)
-            model = Model(self.model).render(evaluations, lookups, configuration, item)
-            resource = self.make_resource(self.provider, uid, model)
+            resource_name, resource = self.resolve_item(
+                name, item, evaluations, lookups, configuration, model_template
+            )
             resources.update({resource_name: resource})
         return resources
 
     def format_uid(self, name: str) -> str:
-        uid_hash = hashlib.md5()
-        uid_hash.update(name.encode())
-        uid = "gdbt_" + uid_hash.hexdigest()
-        return uid
+        return _uid_for(name)
 
 
 @deserialize.downcast_identifier(Template, "dashboard")
-@attr.s(kw_only=True)
+@attr.s(slots=True, kw_only=True)
 class Dashboard(Template):
     folder: str = attr.ib()
 
-    kind = "dashboard"
-
     def make_resource(
         self,
         grafana: str,
@@ -122,7 +159,7 @@ class Dashboard(Template):
         model: str,
     ) -> gdbt.resource.resource.Dashboard:
         try:
-            model_dict = json.loads(model)
+            model_dict = _json_loads(model)
         except json.JSONDecodeError:
             print(model)
             raise
@@ -138,17 +175,15 @@ class Dashboard(Template):
 
 
 @deserialize.downcast_identifier(Template, "folder")
-@attr.s(kw_only=True)
+@attr.s(slots=True, kw_only=True)
 class Folder(Template):
-    kind = "folder"
-
     def make_resource(
         self,
         grafana: str,
         uid: str,
         model: str,
     ) -> gdbt.resource.resource.Folder:
-        model_dict = json.loads(model)
+        model_dict = _json_loads(model)
         resource = gdbt.resource.resource.Folder(
             grafana=grafana,
             uid=uid,
@@ -160,6 +195,17 @@ class Folder(Template):
 @attr.s
 class Model:
     template: str = attr.ib()
+    _compiled: jinja2.Template = attr.ib(init=False)
+
+    @_compiled.default
+    def _compile(self) -> jinja2.Template:
+        env = jinja2.Environment(
+            loader=jinja2.BaseLoader(),
+            variable_start_string=TEMPLATE_VARIABLE_DELIMITER_LEFT,
+            variable_end_string=TEMPLATE_VARIABLE_DELIMITER_RIGHT,
+        )
+        compiled = env.from_string(self.template)
+        return compiled
 
     def render(
         self,
@@ -168,13 +214,7 @@ class Model:
         configuration: Configuration,
         loop_item: typing.Optional[typing.Any] = None,
     ) -> str:
-        env = jinja2.Environment(
-            loader=jinja2.BaseLoader(),
-            variable_start_string=TEMPLATE_VARIABLE_DELIMITER_LEFT,
-            variable_end_string=TEMPLATE_VARIABLE_DELIMITER_RIGHT,
-        )
-        template = env.from_string(self.template)
-        rendered = template.render(
+        rendered = self._compiled.render(
             providers=configuration.providers,
             evaluations=evaluations,
             lookups=lookups,
@@ -254,7 +294,12 @@ class TemplateLoader:
             template_files = self.tag_files(self.list_files(self.path), self.base_path)
             templates_data = self.load_files(template_files)
             for template_tag, template_data in templates_data.items():
-                template = deserialize.deserialize(Template, template_data)
+                try:
+                    template = deserialize.deserialize(Template, template_data)
+                except deserialize.UndefinedDowncastException as exc:
+                    raise gdbt.errors.ConfigFormatInvalid(
+                        f"Invalid kind in {template_tag}: {exc}"
+                    ) from None
                 templates.update({template_tag: template})
         except (
             TypeError,
@@ -274,3 +319,24 @@ def load(
         path = pathlib.Path(typing.cast(str, path))
     templates = TemplateLoader(path).deserialize()
     return templates
+
+
+def resolve(
+    templates: typing.Mapping[str, Template],
+    configuration: Configuration,
+    base: str,
+    update: bool = False,
+) -> typing.Dict[str, typing.Dict[str, Resource]]:
+    threads = configuration.concurrency.threads
+    evaluation_cache = EvaluationCache()
+    resource_futures = {}
+    with concurrent.futures.ThreadPoolExecutor(threads) as pool:
+        for name, template in templates.items():
+            resource_future = pool.submit(
+                template.resolve, name, configuration, base, update, evaluation_cache
+            )
+            resource_futures.update({name: resource_future})
+    resources = {}
+    for name, resource_future in resource_futures.items():
+        resources.update({name: resource_future.result()})
+    return resources
@@ -1,5 +1,5 @@
-from .evaluation import Evaluation, EvaluationLock
+from .evaluation import Evaluation, EvaluationCache, EvaluationLock
 from .lookup import Lookup
 
-# Export Evaluation and EvaluationLock classes, Lookup type alias
-__all__ = ["Evaluation", "EvaluationLock", "Lookup"]
+# Export Evaluation, EvaluationCache and EvaluationLock classes, Lookup type alias
+__all__ = ["Evaluation", "EvaluationCache", "EvaluationLock", "Lookup"]
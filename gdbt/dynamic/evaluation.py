@@ -1,6 +1,8 @@
 import abc
+import concurrent.futures
 import json
 import pathlib
+import threading
 import typing
 
 import attr
@@ -62,3 +64,28 @@ class EvaluationLock:
             return
         with open(self.path, "w") as f_lock:
             json.dump(data, f_lock, sort_keys=True, indent=2, ensure_ascii=True)
+
+
+@attr.s
+class EvaluationCache:
+    _values: typing.Dict[
+        typing.Tuple[type, typing.Tuple[typing.Any, ...]], concurrent.futures.Future
+    ] = attr.ib(init=False, factory=dict)
+    _lock: threading.Lock = attr.ib(init=False, factory=threading.Lock)
+
+    def evaluate(
+        self, evaluation: Evaluation, provider: EvaluationProvider
+    ) -> typing.Any:
+        key = (type(evaluation), attr.astuple(evaluation))
+        with self._lock:
+            future = self._values.get(key)
+            owner = future is None
+            if future is None:
+                future = concurrent.futures.Future()
+                self._values.update({key: future})
+        if owner:
+            try:
+                future.set_result(evaluation.evaluate(provider))
+            except Exception as exc:
+                future.set_exception(exc)
+        return future.result()
@@ -1,28 +1,240 @@
+import asyncio
+import time
 import typing
 import urllib.parse
 
 import attr
+import backoff  # type: ignore
 import deserialize  # type: ignore
-import grafana_api.grafana_api  # type: ignore
-import grafana_api.grafana_face  # type: ignore
+import httpx
 
 from gdbt.provider import Provider
 
+CONNECTION_LIMIT = 64
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_MAX_TIME = 60
+RATE_LIMIT_PAUSE = 1.0
+HTTP_TIMEOUT = 60.0
+
+
+def _giveup(exc: Exception) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code not in RETRY_STATUSES
+    return False
+
+
+@attr.s
+class RateLimiter:
+    rate: typing.Optional[typing.Union[int, float]] = attr.ib(default=None)
+    capacity: float = attr.ib(default=1.0)
+    _tokens: float = attr.ib(init=False)
+    _updated: float = attr.ib(init=False, factory=time.monotonic)
+    _paused_until: float = attr.ib(init=False, default=0.0)
+
+    @_tokens.default
+    def _tokens_default(self) -> float:
+        return self.capacity
+
+    def _refill(self, now: float) -> None:
+        if self.rate:
+            elapsed = now - self._updated
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        while True:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self._paused_until:
+                await asyncio.sleep(self._paused_until - now)
+                continue
+            if not self.rate:
+                return
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def update(self, headers: typing.Mapping[str, str]) -> None:
+        try:
+            remaining = int(headers["X-RateLimit-Remaining"])
+        except (KeyError, ValueError):
+            return
+        if self.rate:
+            self._tokens = min(self._tokens, remaining)
+        if remaining > 0:
+            return
+        try:
+            delay = float(headers["X-RateLimit-Reset"]) - time.time()
+        except (KeyError, ValueError):
+            delay = RATE_LIMIT_PAUSE
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+
+@attr.s
+class AsyncGrafanaClient:
+    endpoint: str = attr.ib()
+    token: typing.Optional[str] = attr.ib()
+    connection_limit: int = attr.ib(default=CONNECTION_LIMIT)
+    rate_limit: typing.Optional[typing.Union[int, float]] = attr.ib(default=None)
+    _session: typing.Optional[httpx.AsyncClient] = attr.ib(init=False, default=None)
+    _semaphore: asyncio.Semaphore = attr.ib(init=False)
+    _limiter: RateLimiter = attr.ib(init=False)
+    _cache: typing.Dict[str, "asyncio.Future[typing.Any]"] = attr.ib(
+        init=False, factory=dict
+    )
+
+    @_semaphore.default
+    def _semaphore_default(self) -> asyncio.Semaphore:
+        return asyncio.Semaphore(self.connection_limit)
+
+    @_limiter.default
+    def _limiter_default(self) -> RateLimiter:
+        return RateLimiter(self.rate_limit, max(self.rate_limit or 1.0, 1.0))
+
+    @property
+    def base_url(self) -> str:
+        endpoint = urllib.parse.urlparse(self.endpoint)
+        base_url = f"{endpoint.scheme}://{endpoint.netloc}"
+        return base_url
+
+    @property
+    def headers(self) -> typing.Dict[str, str]:
+        headers = {"Accept": "application/json"}
+        if self.token:
+            headers.update({"Authorization": f"Bearer {self.token}"})
+        return headers
+
+    @property
+    def session(self) -> httpx.AsyncClient:
+        if self._session is None or self._session.is_closed:
+            limits = httpx.Limits(max_connections=self.connection_limit)
+            self._session = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                http2=True,
+                limits=limits,
+                timeout=HTTP_TIMEOUT,
+            )
+        return self._session
+
+    @staticmethod
+    def _error_message(response: httpx.Response) -> str:
+        try:
+            message = response.json()["message"]
+        except (ValueError, TypeError, KeyError):
+            message = response.reason_phrase
+        return message
+
+    @backoff.on_exception(
+        backoff.expo,
+        exception=(httpx.HTTPStatusError, httpx.TransportError),
+        giveup=_giveup,
+        max_time=RETRY_MAX_TIME,
+    )
+    async def request(
+        self,
+        method: str,
+        path: str,
+        json: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    ) -> typing.Any:
+        async with self._semaphore:
+            await self._limiter.acquire()
+            response = await self.session.request(method, path, json=json)
+        self._limiter.update(response.headers)
+        if response.is_error:
+            raise httpx.HTTPStatusError(
+                self._error_message(response),
+                request=response.request,
+                response=response,
+            )
+        data = response.json() if response.content else None
+        return data
+
+    async def get(self, path: str) -> typing.Any:
+        if path not in self._cache:
+            future = asyncio.ensure_future(self.request("GET", path))
+
+            def forget_failed(future: "asyncio.Future[typing.Any]") -> None:
+                if future.cancelled() or future.exception() is not None:
+                    if self._cache.get(path) is future:
+                        del self._cache[path]
+
+            future.add_done_callback(forget_failed)
+            self._cache.update({path: future})
+        data = await asyncio.shield(self._cache[path])
+        return data
+
+    async def post(self, path: str, json: typing.Dict[str, typing.Any]) -> typing.Any:
+        try:
+            return await self.request("POST", path, json)
+        finally:
+            self.invalidate(path)
+
+    async def put(self, path: str, json: typing.Dict[str, typing.Any]) -> typing.Any:
+        try:
+            return await self.request("PUT", path, json)
+        finally:
+            self.invalidate(path)
+
+    async def delete(self, path: str) -> typing.Any:
+        try:
+            return await self.request("DELETE", path)
+        finally:
+            self.invalidate(path)
+
+    def invalidate(self, path_or_uid: str) -> None:
+        uid = path_or_uid.rstrip("/").rsplit("/", 1)[-1]
+        for path, future in list(self._cache.items()):
+            if path == path_or_uid or path.endswith(f"/{uid}"):
+                del self._cache[path]
+                continue
+            if not future.done() or future.cancelled() or future.exception():
+                continue
+            data = future.result()
+            if isinstance(data, dict) and data.get("uid") == uid:
+                del self._cache[path]
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.aclose()
+        self._session = None
+
 
 @deserialize.downcast_identifier(Provider, "grafana")
+@deserialize.default("connection_limit", CONNECTION_LIMIT)
+@deserialize.default("rate_limit", None)
 @attr.s
 class GrafanaProvider(Provider):
     endpoint: str = attr.ib()
     token: typing.Optional[str] = attr.ib()
+    connection_limit: int = attr.ib(default=CONNECTION_LIMIT)
+    rate_limit: typing.Optional[typing.Union[int, float]] = attr.ib(default=None)
+    _client = None
+
+    @connection_limit.validator
+    def _validate_connection_limit(self, _, connection_limit: int) -> None:
+        if connection_limit < 1:
+            raise ValueError(
+                f"Grafana connection_limit must be at least 1: {connection_limit}"
+            )
+
+    @rate_limit.validator
+    def _validate_rate_limit(
+        self, _, rate_limit: typing.Optional[typing.Union[int, float]]
+    ) -> None:
+        if rate_limit is not None and rate_limit <= 0:
+            raise ValueError(f"Grafana rate_limit must be positive: {rate_limit}")
 
     @property
-    def client(self) -> grafana_api.grafana_face.GrafanaFace:
-        endpoint = urllib.parse.urlparse(self.endpoint)
-        port = endpoint.port or {"http": 80, "https": 443}.get(endpoint.scheme, None)
-        client = grafana_api.grafana_face.GrafanaFace(
-            host=endpoint.hostname,
-            port=port,
-            protocol=endpoint.scheme,
-            auth=self.token,
-        )
-        return client
+    def client(self) -> AsyncGrafanaClient:
+        if self._client is None:
+            self._client = AsyncGrafanaClient(
+                self.endpoint, self.token, self.connection_limit, self.rate_limit
+            )
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+        self._client = None
@@ -57,7 +57,6 @@ class PrometheusEvaluation(Evaluation):
     @property
     def hash(self) -> str:
         data = self.source + self.metric + self.label
-        md5 = hashlib.md5()
-        md5.update(data.encode())
+        md5 = hashlib.md5(data.encode(), usedforsecurity=False)
         digest = md5.hexdigest()
         return digest
@@ -4,14 +4,17 @@ from .resource import (
     ResourceGroupMeta,
     ResourceLoader,
     ResourceMeta,
+    run_concurrently,
 )
 
 # Export Resource and ResourceLoader classes,
-# ResourceGroup, ResourceMeta and ResourceGroupMeta type aliases
+# ResourceGroup, ResourceMeta and ResourceGroupMeta type aliases,
+# run_concurrently helper
 __all__ = [
     "Resource",
     "ResourceGroup",
     "ResourceMeta",
     "ResourceGroupMeta",
     "ResourceLoader",
+    "run_concurrently",
 ]
@@ -1,14 +1,16 @@
 import abc
-import concurrent.futures
+import asyncio
+import contextlib
 import typing
 
 import attr
 import backoff  # type: ignore
 import deserialize  # type: ignore
-import grafana_api.grafana_api  # type: ignore
+import httpx
 
 import gdbt.errors
 from gdbt.code import Configuration
+from gdbt.provider.grafana import RETRY_STATUSES, AsyncGrafanaClient, GrafanaProvider
 
 IGNORED_KEYS = ("id", "uid", "version")
 
@@ -17,15 +19,58 @@ ResourceMeta = typing.NewType("ResourceMeta", typing.Dict[str, str])
 ResourceGroupMeta = typing.NewType("ResourceGroupMeta", typing.Dict[str, ResourceMeta])
 
 
+@contextlib.asynccontextmanager
+async def grafana_errors(uid: str) -> typing.AsyncIterator[None]:
+    try:
+        yield
+    except httpx.HTTPStatusError as exc:
+        if exc.response.status_code == 404:
+            raise gdbt.errors.GrafanaResourceNotFound(uid)
+        if exc.response.status_code in RETRY_STATUSES:
+            raise gdbt.errors.GrafanaServerError(str(exc))
+        raise gdbt.errors.GrafanaError(str(exc))
+    except httpx.HTTPError as exc:
+        raise gdbt.errors.GrafanaError(str(exc))
+
+
+async def _gather(
+    configuration: Configuration, coroutines: typing.Iterable[typing.Awaitable]
+) -> typing.List[typing.Any]:
+    try:
+        results = await asyncio.gather(*coroutines, return_exceptions=True)
+    finally:
+        for provider in configuration.providers.values():
+            if isinstance(provider, GrafanaProvider):
+                await provider.close()
+    return results
+
+
+def run_concurrently(
+    configuration: Configuration, coroutines: typing.Iterable[typing.Awaitable]
+) -> typing.List[typing.Any]:
+    results = asyncio.run(_gather(configuration, coroutines))
+    return results
+
+
+@backoff.on_exception(
+    backoff.expo, exception=gdbt.errors.GrafanaResourceNotFound, max_time=60
+)
+async def _folder_id(client: AsyncGrafanaClient, uid: str) -> int:
+    async with grafana_errors(uid):
+        data = await client.get(f"/api/folders/{uid}")
+    id = data["id"]
+    return id
+
+
 @deserialize.downcast_field("kind")
-@attr.s
+@attr.s(slots=True)
 class Resource(abc.ABC):
     grafana: str = attr.ib()
     uid: str = attr.ib()
     model: typing.Dict[str, typing.Any] = attr.ib()
 
     @abc.abstractclassmethod
-    def create(
+    async def create(
         cls,
         grafana: str,
         uid: str,
@@ -34,7 +79,7 @@ class Resource(abc.ABC):
         pass
 
     @abc.abstractclassmethod
-    def get(
+    async def get(
         cls,
         grafana: str,
         uid: str,
@@ -43,7 +88,7 @@ class Resource(abc.ABC):
         pass
 
     @abc.abstractclassmethod
-    def exists(
+    async def exists(
         cls,
         grafana: str,
         uid: str,
@@ -52,11 +97,11 @@ class Resource(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def id(self, configuration: Configuration) -> int:
+    async def id(self, configuration: Configuration) -> int:
         pass
 
     @abc.abstractmethod
-    def update(
+    async def update(
         self,
         model: typing.Dict[str, typing.Any],
         configuration: Configuration,
@@ -64,13 +109,14 @@ class Resource(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def delete(self, configuration: Configuration) -> None:
+    async def delete(self, configuration: Configuration) -> None:
         pass
 
     @property
-    @abc.abstractmethod
     def serialized(self) -> typing.Dict[str, typing.Any]:
-        pass
+        representation = {"kind": self._kind, **attr.asdict(self, recurse=False)}
+        representation.update({"model": self._model_strip(self.model)})
+        return representation
 
     @property
     def _kind(self) -> str:
@@ -98,12 +144,10 @@ class Resource(abc.ABC):
 
 
 @deserialize.downcast_identifier(Resource, "folder")
+@attr.s(slots=True)
 class Folder(Resource):
     @classmethod
-    @backoff.on_exception(
-        backoff.expo, exception=gdbt.errors.GrafanaServerError, max_time=60
-    )
-    def create(  # type: ignore
+    async def create(  # type: ignore
         cls,
         grafana: str,
         uid: str,
@@ -113,100 +157,83 @@ class Folder(Resource):
         try:
             model_stripped = cls._model_strip(model)
             title = model_stripped["title"]
-            cls.client(grafana, configuration).client.folder.create_folder(title, uid)
+            client = cls.client(grafana, configuration).client
+            async with grafana_errors(uid):
+                try:
+                    await client.post("/api/folders", {"title": title, "uid": uid})
+                except httpx.HTTPStatusError as exc:
+                    if exc.response.status_code != 412:
+                        raise
+            client.invalidate(uid)
         except KeyError:
             raise gdbt.errors.DataError("Folder model missing 'title' key")
-        except grafana_api.grafana_api.GrafanaException as exc:
-            if exc.status_code in (429, 500, 503, 504):
-                raise gdbt.errors.GrafanaServerError(exc.message)
-            if exc.status_code != 412:
-                raise gdbt.errors.GrafanaError(str(exc))
-        folder = cls.get(grafana, uid, configuration)
+        folder = await cls.get(grafana, uid, configuration)
         return folder
 
     @classmethod
     @backoff.on_exception(
         backoff.expo, exception=gdbt.errors.GrafanaResourceNotFound, max_time=60
     )
-    def get(
+    async def get(
         cls,
         grafana: str,
         uid: str,
         configuration: Configuration,
     ) -> "Folder":
-        try:
-            title = cls.client(grafana, configuration).client.folder.get_folder(uid)[
-                "title"
-            ]
-        except grafana_api.grafana_api.GrafanaException as exc:
-            if exc.status_code == 404:
-                raise gdbt.errors.GrafanaResourceNotFound(uid)
-            if exc.status_code in (429, 500, 503, 504):
-                raise gdbt.errors.GrafanaServerError(exc.message)
-            raise gdbt.errors.GrafanaError(str(exc))
-        model = {"title": title}
+        async with grafana_errors(uid):
+            data = await cls.client(grafana, configuration).client.get(
+                f"/api/folders/{uid}"
+            )
+        model = {"title": data["title"]}
         model_stripped = cls._model_strip(model)
         folder = cls(grafana, uid, model_stripped)
         return folder
 
     @classmethod
-    def exists(
+    async def exists(
         cls,
         grafana: str,
         uid: str,
         configuration: Configuration,
     ) -> bool:
         try:
-            cls.client(grafana, configuration).client.folder.get_folder(uid)
-        except grafana_api.grafana_api.GrafanaException as exc:
-            if exc.status_code == 404:
-                return False
-            if exc.status_code in (429, 500, 503, 504):
-                raise gdbt.errors.GrafanaServerError(exc.message)
-            raise gdbt.errors.GrafanaError(str(exc))
+            async with grafana_errors(uid):
+                await cls.client(grafana, configuration).client.get(
+                    f"/api/folders/{uid}"
+                )
+        except gdbt.errors.GrafanaResourceNotFound:
+            return False
         return True
 
     @classmethod
     @backoff.on_exception(
         backoff.expo, exception=gdbt.errors.GrafanaResourceNotFound, max_time=60
     )
-    def get_by_id(
+    async def get_by_id(
         cls,
         grafana: str,
         id: int,
         configuration: Configuration,
     ) -> "Folder":
-        try:
-            data = cls.client(grafana, configuration).client.folder.get_folder_by_id(id)
-        except grafana_api.grafana_api.GrafanaException as exc:
-            if exc.status_code == 404:
-                raise gdbt.errors.GrafanaResourceNotFound(f"ID: {id}")
-            if exc.status_code in (429, 500, 503, 504):
-                raise gdbt.errors.GrafanaServerError(exc.message)
-            raise gdbt.errors.GrafanaError(str(exc))
+        async with grafana_errors(f"ID: {id}"):
+            data = await cls.client(grafana, configuration).client.get(
+                f"/api/folders/id/{id}"
+            )
         model = {"title": data["title"]}
         model_stripped = cls._model_strip(model)
         uid = data["uid"]
         folder = cls(grafana, uid, model_stripped)
         return folder
 
-    def id(self, configuration: Configuration) -> int:
-        try:
-            id = self.client(self.grafana, configuration).client.folder.get_folder(
-                self.uid
-            )["id"]
-        except grafana_api.grafana_api.GrafanaException as exc:
-            if exc.status_code == 404:
-                raise gdbt.errors.GrafanaResourceNotFound(self.uid)
-            if exc.status_code in (429, 500, 503, 504):
-                raise gdbt.errors.GrafanaServerError(exc.message)
-            raise gdbt.errors.GrafanaError(str(exc))
+    async def id(self, configuration: Configuration) -> int:
+        async with grafana_errors(self.uid):
+            data = await self.client(self.grafana, configuration).client.get(
+                f"/api/folders/{self.uid}"
+            )
+        id = data["id"]
         return id
 
-    @backoff.on_exception(
-        backoff.expo, exception=gdbt.errors.GrafanaServerError, max_time=60
-    )
-    def update(
+    async def update(
         self,
         model: typing.Dict[str, typing.Any],
         configuration: Configuration,
@@ -214,56 +241,31 @@ class Folder(Resource):
         try:
             model_stripped = self._model_strip(model)
             title = model_stripped["title"]
-            self.client(self.grafana, configuration).client.folder.update_folder(
-                self.uid, title, overwrite=True
-            )
-            return self
         except KeyError:
             raise gdbt.errors.DataError("Folder model missing 'title' key")
-        except grafana_api.grafana_api.GrafanaException as exc:
-            if exc.status_code == 404:
-                raise gdbt.errors.GrafanaResourceNotFound(self.uid)
-            if exc.status_code in (429, 500, 503, 504):
-                raise gdbt.errors.GrafanaServerError(exc.message)
-            raise gdbt.errors.GrafanaError(str(exc))
-
-    @backoff.on_exception(
-        backoff.expo, exception=gdbt.errors.GrafanaServerError, max_time=60
-    )
-    def delete(self, configuration: Configuration) -> None:
-        try:
-            self.client(self.grafana, configuration).client.folder.delete_folder(
-                self.uid
+        async with grafana_errors(self.uid):
+            await self.client(self.grafana, configuration).client.put(
+                f"/api/folders/{self.uid}", {"title": title, "overwrite": True}
             )
-        except grafana_api.grafana_api.GrafanaException as exc:
-            if exc.status_code == 404:
-                return
-            if exc.status_code in (429, 500, 503, 504):
-                raise gdbt.errors.GrafanaServerError(exc.message)
-            raise gdbt.errors.GrafanaError(str(exc))
+        return self
 
-    @property
-    def serialized(self) -> typing.Dict[str, typing.Any]:
-        model_stripped = self._model_strip(self.model)
-        representation = {
-            "kind": self._kind,
-            "grafana": self.grafana,
-            "uid": self.uid,
-            "model": model_stripped,
-        }
-        return representation
+    async def delete(self, configuration: Configuration) -> None:
+        try:
+            async with grafana_errors(self.uid):
+                await self.client(self.grafana, configuration).client.delete(
+                    f"/api/folders/{self.uid}"
+                )
+        except gdbt.errors.GrafanaResourceNotFound:
+            return
 
 
 @deserialize.downcast_identifier(Resource, "dashboard")
-@attr.s
+@attr.s(slots=True)
 class Dashboard(Resource):
     folder: str = attr.ib()
 
     @classmethod
-    @backoff.on_exception(
-        backoff.expo, exception=gdbt.errors.GrafanaServerError, max_time=60
-    )
-    def create(  # type: ignore
+    async def create(  # type: ignore
         cls,
         grafana: str,
         uid: str,
@@ -273,153 +275,104 @@ class Dashboard(Resource):
     ) -> "Dashboard":
         model_stripped = cls._model_strip(model)
         model_stripped.update({"id": None, "uid": uid, "version": 1})
+        client = cls.client(grafana, configuration).client
         meta = {
             "dashboard": model_stripped,
-            "folderId": Folder.get(grafana, folder, configuration).id(configuration),
+            "folderId": await _folder_id(client, folder),
             "overwrite": True,
         }
-        try:
-            cls.client(grafana, configuration).client.dashboard.update_dashboard(meta)
-        except grafana_api.grafana_api.GrafanaException as exc:
-            if exc.status_code in (429, 500, 503, 504):
-                raise gdbt.errors.GrafanaServerError(exc.message)
-            raise gdbt.errors.GrafanaError(str(exc))
-        return cls.get(grafana, uid, configuration)
+        async with grafana_errors(uid):
+            await client.post("/api/dashboards/db", meta)
+        client.invalidate(uid)
+        return await cls.get(grafana, uid, configuration)
 
     @classmethod
     @backoff.on_exception(
         backoff.expo, exception=gdbt.errors.GrafanaResourceNotFound, max_time=60
     )
-    def get(
+    async def get(
         cls,
         grafana: str,
         uid: str,
         configuration: Configuration,
     ) -> "Dashboard":
-        try:
-            dashboard = cls.client(
-                grafana, configuration
-            ).client.dashboard.get_dashboard(uid)
-        except grafana_api.grafana_api.GrafanaException as exc:
-            if exc.status_code == 404:
-                raise gdbt.errors.GrafanaResourceNotFound(uid)
-            if exc.status_code in (429, 500, 503, 504):
-                raise gdbt.errors.GrafanaServerError(exc.message)
-            raise gdbt.errors.GrafanaError(str(exc))
-        model = dashboard["dashboard"]
+        async with grafana_errors(uid):
+            data = await cls.client(grafana, configuration).client.get(
+                f"/api/dashboards/uid/{uid}"
+            )
+        model = data["dashboard"]
         model_stripped = cls._model_strip(model)
-        folder = Folder.get_by_id(
-            grafana, dashboard["meta"]["folderId"], configuration
-        ).uid
-        dashboard = cls(grafana, uid, model_stripped, folder)
+        folder_resource = await Folder.get_by_id(
+            grafana, data["meta"]["folderId"], configuration
+        )
+        dashboard = cls(grafana, uid, model_stripped, folder_resource.uid)
         return dashboard
 
     @classmethod
-    def exists(
+    async def exists(
         cls,
         grafana: str,
         uid: str,
         configuration: Configuration,
     ) -> bool:
         try:
-            cls.client(grafana, configuration).client.dashboard.get_dashboard(uid)
-        except grafana_api.grafana_api.GrafanaException as exc:
-            if exc.status_code == 404:
-                return False
-            if exc.status_code in (429, 500, 503, 504):
-                raise gdbt.errors.GrafanaServerError(exc.message)
-            raise gdbt.errors.GrafanaError(str(exc))
+            async with grafana_errors(uid):
+                await cls.client(grafana, configuration).client.get(
+                    f"/api/dashboards/uid/{uid}"
+                )
+        except gdbt.errors.GrafanaResourceNotFound:
+            return False
         return True
 
-    def id(self, configuration: Configuration) -> int:
-        try:
-            dashboard = self.client(
-                self.grafana, configuration
-            ).client.dashboard.get_dashboard(self.uid)
-        except grafana_api.grafana_api.GrafanaException as exc:
-            if exc.status_code == 404:
-                raise gdbt.errors.GrafanaResourceNotFound(self.uid)
-            if exc.status_code in (429, 500, 503, 504):
-                raise gdbt.errors.GrafanaServerError(exc.message)
-            raise gdbt.errors.GrafanaError(str(exc))
-        id = dashboard["dashboard"]["id"]
+    async def _fetch_dashboard(
+        self, client: AsyncGrafanaClient
+    ) -> typing.Dict[str, typing.Any]:
+        async with grafana_errors(self.uid):
+            data = await client.get(f"/api/dashboards/uid/{self.uid}")
+        dashboard = data["dashboard"]
+        return dashboard
+
+    async def id(self, configuration: Configuration) -> int:
+        client = self.client(self.grafana, configuration).client
+        dashboard = await self._fetch_dashboard(client)
+        id = dashboard["id"]
         return id
 
-    def version(self, configuration: Configuration) -> int:
-        try:
-            dashboard = self.client(
-                self.grafana, configuration
-            ).client.dashboard.get_dashboard(self.uid)
-        except grafana_api.grafana_api.GrafanaException as exc:
-            if exc.status_code == 404:
-                raise gdbt.errors.GrafanaResourceNotFound(self.uid)
-            if exc.status_code in (429, 500, 503, 504):
-                raise gdbt.errors.GrafanaServerError(exc.message)
-            raise gdbt.errors.GrafanaError(str(exc))
-        version = dashboard["dashboard"]["version"]
+    async def version(self, configuration: Configuration) -> int:
+        client = self.client(self.grafana, configuration).client
+        dashboard = await self._fetch_dashboard(client)
+        version = dashboard["version"]
         return version
 
-    @backoff.on_exception(
-        backoff.expo, exception=gdbt.errors.GrafanaServerError, max_time=60
-    )
-    def update(
+    async def update(
         self,
         model: typing.Dict[str, typing.Any],
         configuration: Configuration,
     ) -> "Dashboard":
-        try:
-            version_new = self.version(configuration) + 1
-        except TypeError:
-            version_new = 1
+        client = self.client(self.grafana, configuration).client
+        dashboard = await self._fetch_dashboard(client)
+        id = dashboard["id"]
+        version_new = (dashboard.get("version") or 0) + 1
         model_stripped = self._model_strip(model)
-        model_stripped.update(
-            {"id": self.id(configuration), "uid": self.uid, "version": version_new}
-        )
+        model_stripped.update({"id": id, "uid": self.uid, "version": version_new})
         meta = {
             "dashboard": model_stripped,
-            "folderId": Folder.get(self.grafana, self.folder, configuration).id(
-                configuration
-            ),
+            "folderId": await _folder_id(client, self.folder),
             "overwrite": True,
         }
-        try:
-            self.client(self.grafana, configuration).client.dashboard.update_dashboard(
-                meta
-            )
-            return self
-        except grafana_api.grafana_api.GrafanaException as exc:
-            if exc.status_code == 404:
-                raise gdbt.errors.GrafanaResourceNotFound(self.uid)
-            if exc.status_code in (429, 500, 503, 504):
-                raise gdbt.errors.GrafanaServerError(exc.message)
-            raise gdbt.errors.GrafanaError(str(exc))
+        async with grafana_errors(self.uid):
+            await client.post("/api/dashboards/db", meta)
+        client.invalidate(self.uid)
+        return self
 
-    @backoff.on_exception(
-        backoff.expo, exception=gdbt.errors.GrafanaServerError, max_time=60
-    )
-    def delete(self, configuration: Configuration) -> None:
+    async def delete(self, configuration: Configuration) -> None:
         try:
-            self.client(self.grafana, configuration).client.dashboard.delete_dashboard(
-                self.uid
-            )
-        except grafana_api.grafana_api.GrafanaException as exc:
-            if exc.status_code == 404:
-                return
-            if exc.status_code in (429, 500, 503, 504):
-                raise gdbt.errors.GrafanaServerError(exc.message)
-            raise gdbt.errors.GrafanaError(str(exc))
-
-    @property
-    def serialized(self) -> typing.Dict[str, typing.Any]:
-        model_stripped = self._model_strip(self.model)
-        representation = {
-            "kind": self._kind,
-            "grafana": self.grafana,
-            "uid": self.uid,
-            "model": model_stripped,
-            "folder": self.folder,
-        }
-        return representation
+            async with grafana_errors(self.uid):
+                await self.client(self.grafana, configuration).client.delete(
+                    f"/api/dashboards/uid/{self.uid}"
+                )
+        except gdbt.errors.GrafanaResourceNotFound:
+            return
 
 
 @attr.s
@@ -431,12 +384,9 @@ class ResourceLoader:
     def load(
         self, resources_meta: typing.Mapping[str, ResourceGroupMeta]
     ) -> typing.Dict[str, ResourceGroup]:
-        threads = self.configuration.concurrency.threads
-        pool = concurrent.futures.ThreadPoolExecutor(threads)
-        resources = {}
-        resource_futures = {}
+        resource_keys = []
+        resource_coroutines = []
         for group_name, group_meta in resources_meta.items():
-            resource_group_futures = {}
             for resource_name, resource_meta in group_meta.items():
                 try:
                     resource_cls = typing.cast(
@@ -446,25 +396,21 @@ class ResourceLoader:
                     raise gdbt.errors.ConfigError(
                         f"Invalid resource kind: {resource_meta['kind']}"
                     )
-                resource_future = pool.submit(
-                    resource_cls.get,
+                resource_coroutine = resource_cls.get(
                     resource_meta["grafana"],
                     resource_meta["uid"],
                     self.configuration,
                 )
-                resource_group_futures.update({resource_name: resource_future})
-            resource_futures.update({group_name: resource_group_futures})
-        for group_name, group_futures in resource_futures.items():
-            group_resources = {}
-            for resource_name, resource_future in group_futures.items():
-                exc = resource_future.exception()
-                if isinstance(exc, gdbt.errors.GrafanaResourceNotFound):
-                    continue
-                if exc is not None:
-                    raise exc
-                resource = resource_future.result(
-                    timeout=self.configuration.concurrency.timeout
-                )
-                group_resources.update({resource_name: resource})
-            resources.update({group_name: group_resources})
+                resource_keys.append((group_name, resource_name))
+                resource_coroutines.append(resource_coroutine)
+        results = run_concurrently(self.configuration, resource_coroutines)
+        resources: typing.Dict[str, typing.Dict[str, Resource]] = {
+            group_name: {} for group_name in resources_meta.keys()
+        }
+        for (group_name, resource_name), result in zip(resource_keys, results):
+            if isinstance(result, gdbt.errors.GrafanaResourceNotFound):
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            resources[group_name].update({resource_name: result})
         return typing.cast(typing.Dict[str, ResourceGroup], resources)
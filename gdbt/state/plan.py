@@ -1,5 +1,4 @@
 import collections
-import concurrent.futures
 import enum
 import typing
 
@@ -9,7 +8,7 @@ import flatten_dict  # type: ignore
 import rich.style
 
 from gdbt.code import Configuration
-from gdbt.resource import Resource, ResourceGroup
+from gdbt.resource import Resource, ResourceGroup, run_concurrently
 
 ACTION_SYMBOLS = {"CREATE": "+", "REMOVE": "-", "UPDATE": "~"}
 ACTION_COLORS = {
@@ -319,9 +318,7 @@ class PlanRunner:
         resources_current: typing.Mapping[str, ResourceGroup],
         resources_desired: typing.Mapping[str, ResourceGroup],
     ) -> None:
-        threads = configuration.concurrency.threads
-        pool = concurrent.futures.ThreadPoolExecutor(threads)
-        action_futures = []
+        action_coroutines = []
         resources = self.resources(resources_current, resources_desired)
         for name, resource in resources.items():
             outcome = self.summary[name]
@@ -329,24 +326,20 @@ class PlanRunner:
                 resource_serialized = resource.serialized
                 resource_serialized.pop("kind", None)
                 if outcome == Plan.Outcome.CREATE:
-                    future = pool.submit(
-                        resource.create,
+                    coroutine = resource.create(
                         configuration=configuration,
                         **resource_serialized,
                     )
                 else:
-                    future = pool.submit(
-                        resource.update,
+                    coroutine = resource.update(
                         configuration=configuration,
                         model=resource_serialized["model"],
                     )
-                action_futures.append(future)
+                action_coroutines.append(coroutine)
             if outcome == Plan.Outcome.REMOVE:
-                future = pool.submit(resource.delete, configuration=configuration)  # type: ignore
-                action_futures.append(future)
-        results, _ = concurrent.futures.wait(
-            action_futures, timeout=configuration.concurrency.timeout
-        )
+                coroutine = resource.delete(configuration=configuration)  # type: ignore
+                action_coroutines.append(coroutine)
+        results = run_concurrently(configuration, action_coroutines)
         for result in results:
-            if result.exception() is not None:
-                raise result.exception()  # type: ignore
+            if isinstance(result, BaseException):
+                raise result